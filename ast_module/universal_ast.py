@@ -1,17 +1,27 @@
 # universal_code_converter/ast_module/universal_ast.py
+from collections.abc import Sequence
 
 class Node:
     """Base class for all AST nodes."""
+    # Nodes are allocated in bulk, so every subclass declares its fields in
+    # __slots__ instead of carrying a per-instance __dict__.
+    __slots__ = ()
+
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.__dict__})"
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        return f"{self.__class__.__name__}({fields})"
 
 class ProgramNode(Node):
     """Represents the entire program, a collection of statements."""
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements  # List of statement nodes
 
 class FunctionNode(Node):
     """Represents a function definition."""
+    __slots__ = ('name', 'args', 'body')
+
     def __init__(self, name, args, body):
         self.name = name      # String: function name
         self.args = args      # List of strings: argument names
@@ -19,11 +29,15 @@ class FunctionNode(Node):
 
 class PrintNode(Node):
     """Represents a print or output statement."""
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression  # Node: the expression to print
 
 class MathOpNode(Node):
     """Represents a mathematical operation."""
+    __slots__ = ('operator', 'left', 'right')
+
     def __init__(self, operator, left, right):
         self.operator = operator  # String: e.g., '+', '-', '*', '/'
         self.left = left          # Node: left operand
@@ -31,11 +45,15 @@ class MathOpNode(Node):
 
 class VariableNode(Node):
     """Represents a variable identifier."""
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name  # String: variable name
 
 class StringLiteralNode(Node):
     """Represents a string literal."""
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value  # String: the actual string value
 
@@ -43,33 +61,44 @@ class NumberLiteralNode(Node):
     """Represents a number literal."""
     # For simplicity, we'll treat all numbers as strings initially in the AST
     # and let the generator handle specific formatting if needed.
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value # String: numeric value as a string
 
 class PowerNode(Node):
     """Represents a power/pow function call (e.g., pow(base, exponent))."""
+    __slots__ = ('base', 'exponent')
+
     def __init__(self, base, exponent):
         self.base = base          # Node: base expression
         self.exponent = exponent  # Node: exponent expression
 
 class ForLoopNode(Node):
     """Represents a for loop."""
-    def __init__(self, iterator, iterable, body):
+    __slots__ = ('iterator', 'iterable', 'body', 'range_info')
+
+    def __init__(self, iterator, iterable, body, range_info=None):
         self.iterator = iterator  # String: iterator variable name
         self.iterable = iterable  # String: range expression or other iterable
         self.body = body         # List of statement nodes: loop body
+        self.range_info = range_info  # Tuple of strings (start, end, step) when iterable is a range, else None
 
     def __repr__(self):
         return f"ForLoopNode(iterator='{self.iterator}', iterable='{self.iterable}', body={self.body})"
 
 class WhileLoopNode(Node):
     """Represents a while loop."""
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition = condition  # Node: condition expression
         self.body = body           # List of statement nodes: loop body
 
 class ComparisonNode(Node):
     """Represents a comparison operation."""
+    __slots__ = ('operator', 'left', 'right')
+
     def __init__(self, operator, left, right):
         self.operator = operator  # String: e.g., '<', '>', '<=', '>=', '==', '!='
         self.left = left          # Node: left operand
@@ -77,11 +106,48 @@ class ComparisonNode(Node):
 
 class AssignmentNode(Node):
     """Represents a variable assignment."""
+    __slots__ = ('target', 'value')
+
     def __init__(self, target, value):
         self.target = target  # Node: target variable
         self.value = value    # Node: value to assign
 
 class FunctionCallNode(Node):
+    __slots__ = ('name', 'args')
+
     def __init__(self, name, args):
         self.name = name
         self.args = args
+
+class LazyBody(Sequence):
+    """A block body whose statements are parsed on first access.
+
+    Used in place of a statement list by parsers asked to parse lazily:
+    parse(*args) must return the list of statement nodes. It is called at
+    most once, so bodies that are never walked are never parsed.
+    """
+    __slots__ = ('_parse', '_args', '_statements')
+
+    def __init__(self, parse, *args):
+        self._parse = parse
+        self._args = args
+        self._statements = None
+
+    @property
+    def statements(self):
+        if self._statements is None:
+            self._statements = self._parse(*self._args)
+            self._parse = self._args = None  # Release the source references
+        return self._statements
+
+    def __getitem__(self, index):
+        return self.statements[index]
+
+    def __len__(self):
+        return len(self.statements)
+
+    def __iter__(self):
+        return iter(self.statements)
+
+    def __repr__(self):
+        return repr(self.statements)
@@ -2,26 +2,123 @@
 from ast_module.universal_ast import (
     Node, ProgramNode, FunctionNode, PrintNode, MathOpNode,
     VariableNode, StringLiteralNode, NumberLiteralNode, PowerNode,
-    ForLoopNode, WhileLoopNode, ComparisonNode, AssignmentNode
+    ForLoopNode, WhileLoopNode, ComparisonNode, AssignmentNode, FunctionCallNode
+)
+
+# Node classes roughly from most to least frequent in a parsed program; the
+# generated visit() of each generator tests them in this order.
+_VISIT_ORDER = (
+    VariableNode, NumberLiteralNode, MathOpNode, StringLiteralNode,
+    ComparisonNode, PrintNode, AssignmentNode, PowerNode, ForLoopNode,
+    WhileLoopNode, FunctionNode, FunctionCallNode, ProgramNode
 )
 
 class BaseGenerator:
     """
     Base class for code generators. Uses the Visitor pattern.
     """
+    # Maps node class -> unbound visitor function. Each subclass gets its own
+    # table (see __init_subclass__) so overrides are never shadowed by a
+    # parent's cached entry.
+    _visit_cache = {}
+    # Expression nodes whose code depends only on the subtree, never on
+    # generator state such as the indent level, so it can be reused when
+    # the same node object is visited again. Leaves that just return an
+    # attribute (VariableNode, NumberLiteralNode) are cheaper to revisit.
+    _memoized_node_classes = frozenset({
+        MathOpNode, ComparisonNode, PowerNode, StringLiteralNode
+    })
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._visit_cache = {}
+        if 'visit' not in cls.__dict__:
+            cls.visit = cls._compile_visit()
+
+    @classmethod
+    def _compile_visit(cls):
+        """
+        Generates a visit() specialised for this generator class: a chain of
+        `type(node) is X` tests calling the resolved visitor directly, with
+        the memo inlined for _memoized_node_classes. Any other value goes
+        through the generic BaseGenerator.visit.
+        """
+        namespace = {'generic_dispatch': BaseGenerator.visit}
+        source = ["def visit(self, node):", "    node_class = type(node)"]
+        for node_class in _VISIT_ORDER:
+            name = node_class.__name__
+            visitor = getattr(cls, 'visit_' + name, None)
+            if visitor is None:
+                continue
+            namespace[name] = node_class
+            namespace['visit_' + name] = visitor
+            source.append(f"    if node_class is {name}:")
+            if node_class in cls._memoized_node_classes:
+                source += [
+                    "        code = self._memo.get(node)",
+                    "        if code is None:",
+                    f"            code = self._memo[node] = visit_{name}(self, node)",
+                    "        return code",
+                ]
+            else:
+                source.append(f"        return visit_{name}(self, node)")
+        source.append("    return generic_dispatch(self, node)")
+        exec(compile("\n".join(source), f"<{cls.__name__}.visit>", "exec"), namespace)
+        visit = namespace['visit']
+        visit.__qualname__ = f"{cls.__qualname__}.visit"
+        return visit
+
     def __init__(self, indent_char='    ', initial_indent_level=0):
         self.indent_char = indent_char
         self.current_indent_level = initial_indent_level
+        # Indent strings by level; extended on demand by _make_indent.
+        self._indent_cache = [indent_char * level for level in range(6)]
+        # Output buffer for generators whose statement visitors emit()
+        # fragments instead of returning strings; joined once at the root.
+        self._out = []
+        # Node -> generated code for _memoized_node_classes. Nodes hash by
+        # identity, and keeping them as keys keeps them alive for the
+        # generator's lifetime, so entries can never go stale.
+        self._memo = {}
 
     def _make_indent(self):
-        return self.indent_char * self.current_indent_level
+        try:
+            return self._indent_cache[self.current_indent_level]
+        except IndexError:
+            cache = self._indent_cache
+            while len(cache) <= self.current_indent_level:
+                cache.append(self.indent_char * len(cache))
+            return cache[self.current_indent_level]
 
     def visit(self, node):
-        if isinstance(node, Node):
-            method_name = f'visit_{node.__class__.__name__}'
-            visitor = getattr(self, method_name, self.generic_visit)
-            return visitor(node)
-        return str(node)
+        node_class = type(node)
+        visitor = type(self)._visit_cache.get(node_class)
+        if visitor is None:
+            visitor = self._resolve_visitor(node_class)
+        if node_class in self._memoized_node_classes:
+            code = self._memo.get(node)
+            if code is None:
+                code = self._memo[node] = visitor(self, node)
+            return code
+        return visitor(self, node)
+
+    @classmethod
+    def _resolve_visitor(cls, node_class):
+        """Looks up (once per class) the visitor function for a node class."""
+        if issubclass(node_class, Node):
+            visitor = getattr(cls, 'visit_' + node_class.__name__, cls.generic_visit)
+        else:
+            visitor = cls.generic_visit
+        cls._visit_cache[node_class] = visitor
+        return visitor
+
+    def emit(self, code):
+        self._out.append(code)
+
+    def _emit_statement(self, stmt):
+        code = self.visit(stmt)
+        if code is not None: # Expression nodes return their code instead of emitting it
+            self.emit(code)
 
     def generic_visit(self, node):
         return str(node)
@@ -78,59 +175,59 @@ class JavaGenerator(BaseGenerator):
         # For simplicity, we'll assume functions are static methods.
         # Any "loose" statements (like print) will be put inside a main method.
         
-        main_method_body_statements = []
-        static_method_definitions = []
-
-        for stmt in node.statements:
-            if isinstance(stmt, FunctionNode):
-                static_method_definitions.append(self.visit(stmt))
-            else: # Assume other statements go into main
-                main_method_body_statements.append(self.visit(stmt) + ";") # Add semicolon
-
-        self.current_indent_level = 1 # Indent for class content
-        
-        main_method_code = ""
-        if main_method_body_statements:
-            main_body_str = "\n".join([self._make_indent() + self._make_indent() + s for s in main_method_body_statements]) # Double indent for main
-            main_method_code = (
-                f"{self._make_indent()}public static void main(String[] args) {{\n"
-                f"{main_body_str}\n"
-                f"{self._make_indent()}}}"
-            )
-
-        static_methods_code = "\n\n".join(static_method_definitions)
-        
-        self.current_indent_level = 0 # Reset for class definition
-        class_body_parts = []
-        if static_methods_code:
-            class_body_parts.append(static_methods_code)
-        if main_method_code:
-            class_body_parts.append(main_method_code)
-        
-        class_body_str = "\n\n".join(class_body_parts)
-
-        return (
-            "public class ConvertedCode {\n"
-            f"{class_body_str}\n"
-            "}"
-        )
+        self._out = []
+        static_methods = [stmt for stmt in node.statements if isinstance(stmt, FunctionNode)]
+        # Assume other statements go into main
+        main_statements = [stmt for stmt in node.statements if not isinstance(stmt, FunctionNode)]
+
+        self.emit("public class ConvertedCode {\n")
+        for index, stmt in enumerate(static_methods):
+            if index:
+                self.emit("\n\n")
+            self.visit(stmt)
+
+        if main_statements:
+            if static_methods:
+                self.emit("\n\n")
+            indent = self.indent_char # Indent for class content
+            body_indent = indent + indent # Double indent for main
+            self.emit(f"{indent}public static void main(String[] args) {{\n")
+            for index, stmt in enumerate(main_statements):
+                if index:
+                    self.emit("\n")
+                self.emit(body_indent)
+                self._emit_statement(stmt)
+                self.emit(";") # Add semicolon
+            self.emit(f"\n{indent}}}")
+        self.emit("\n}")
+
+        self.current_indent_level = 0 # Reset for the next program
+        return "".join(self._out)
+
+    def _emit_body(self, body):
+        self.current_indent_level += 1
+        if body:
+            for index, stmt in enumerate(body):
+                if index:
+                    self.emit("\n")
+                self._emit_statement(stmt)
+                self.emit(";") # Java statements end with a semicolon.
+        else:
+            self.emit(f"{self._make_indent()}// Empty body") # Or just an empty line
+        self.current_indent_level -= 1
 
     def visit_FunctionNode(self, node):
         # Assume String type for all args for simplicity.
         args_str = ", ".join([f"String {arg}" for arg in node.args])
         # Assume void return type for all functions.
-        header = f"{self._make_indent()}public static void {node.name}({args_str}) {{"
-        self.current_indent_level += 1
-        # Java statements end with a semicolon.
-        body_code = "\n".join([self.visit(stmt) + ";" for stmt in node.body])
-        if not node.body:
-            body_code = f"{self._make_indent()}// Empty body" # Or just an empty line
-        self.current_indent_level -= 1
-        return f"{header}\n{body_code}\n{self._make_indent()}}}"
+        indent = self._make_indent()
+        self.emit(f"{indent}public static void {node.name}({args_str}) {{\n")
+        self._emit_body(node.body)
+        self.emit(f"\n{indent}}}")
 
     def visit_PrintNode(self, node):
         expr_code = self.visit(node.expression)
-        return f"{self._make_indent()}System.out.println({expr_code})"
+        self.emit(f"{self._make_indent()}System.out.println({expr_code})")
 
     def visit_PowerNode(self, node):
         base_code = self.visit(node.base)
@@ -141,104 +238,79 @@ class JavaGenerator(BaseGenerator):
 
     def visit_ForLoopNode(self, node):
         iterator = node.iterator
-        iterable = self.visit(node.iterable)
-        
-        # Convert Python range to Java for loop
-        if isinstance(iterable, str) and iterable.startswith("range("):
-            # Parse range arguments
-            range_args = iterable[6:-1].split(',')
-            if len(range_args) == 1:
-                # range(n) -> for(int i = 0; i < n; i++)
-                end = range_args[0].strip()
-                header = f"{self._make_indent()}for (int {iterator} = 0; {iterator} < {end}; {iterator}++) {{"
-            elif len(range_args) == 2:
-                # range(start, end) -> for(int i = start; i < end; i++)
-                start = range_args[0].strip()
-                end = range_args[1].strip()
-                header = f"{self._make_indent()}for (int {iterator} = {start}; {iterator} < {end}; {iterator}++) {{"
-            else:
-                # range(start, end, step) -> for(int i = start; i < end; i += step)
-                start = range_args[0].strip()
-                end = range_args[1].strip()
-                step = range_args[2].strip()
-                header = f"{self._make_indent()}for (int {iterator} = {start}; {iterator} < {end}; {iterator} += {step}) {{"
+        indent = self._make_indent()
+
+        if node.range_info:
+            # Structured range from the parser: no need to re-parse the iterable string
+            start, end, step = node.range_info
+            header = f"{indent}for (int {iterator} = {start}; {iterator} < {end}; {iterator} += {step}) {{"
         else:
-            # For other iterables, use enhanced for loop
-            header = f"{self._make_indent()}for (String {iterator} : {iterable}) {{"
-        
-        self.current_indent_level += 1
-        body_code = "\n".join([self.visit(stmt) + ";" for stmt in node.body])
-        if not node.body:
-            body_code = f"{self._make_indent()}// Empty body"
-        self.current_indent_level -= 1
-        return f"{header}\n{body_code}\n{self._make_indent()}}}"
+            iterable = self.visit(node.iterable)
+            # Convert Python range to Java for loop
+            if iterable.startswith("range("):
+                # Parse range arguments
+                range_args = [arg.strip() for arg in iterable[6:-1].split(',')]
+                if len(range_args) == 1:
+                    # range(n) -> for(int i = 0; i < n; i++)
+                    end = range_args[0]
+                    header = f"{indent}for (int {iterator} = 0; {iterator} < {end}; {iterator}++) {{"
+                elif len(range_args) == 2:
+                    # range(start, end) -> for(int i = start; i < end; i++)
+                    start, end = range_args
+                    header = f"{indent}for (int {iterator} = {start}; {iterator} < {end}; {iterator}++) {{"
+                else:
+                    # range(start, end, step) -> for(int i = start; i < end; i += step)
+                    start, end, step = range_args[:3]
+                    header = f"{indent}for (int {iterator} = {start}; {iterator} < {end}; {iterator} += {step}) {{"
+            else:
+                # For other iterables, use enhanced for loop
+                header = f"{indent}for (String {iterator} : {iterable}) {{"
+
+        self.emit(header + "\n")
+        self._emit_body(node.body)
+        self.emit(f"\n{indent}}}")
 
     def visit_WhileLoopNode(self, node):
         condition = self.visit(node.condition)
-        header = f"{self._make_indent()}while ({condition}) {{"
-        self.current_indent_level += 1
-        body_code = "\n".join([self.visit(stmt) + ";" for stmt in node.body])
-        if not node.body:
-            body_code = f"{self._make_indent()}// Empty body"
-        self.current_indent_level -= 1
-        return f"{header}\n{body_code}\n{self._make_indent()}}}"
+        indent = self._make_indent()
+        self.emit(f"{indent}while ({condition}) {{\n")
+        self._emit_body(node.body)
+        self.emit(f"\n{indent}}}")
 
     def visit_AssignmentNode(self, node):
         target = self.visit(node.target)
         value = self.visit(node.value)
-        return f"{self._make_indent()}int {target} = {value}"
+        self.emit(f"{self._make_indent()}int {target} = {value}")
 
 # --- Python Generator ---
 class PythonGenerator(BaseGenerator):
-    def visit(self, node):
-        if isinstance(node, ProgramNode):
-            return self.visit_program(node)
-        elif isinstance(node, FunctionNode):
-            return self.visit_function(node)
-        elif isinstance(node, PrintNode):
-            return self.visit_print(node)
-        elif isinstance(node, MathOpNode):
-            return self.visit_math_op(node)
-        elif isinstance(node, VariableNode):
-            return self.visit_variable(node)
-        elif isinstance(node, StringLiteralNode):
-            return self.visit_string_literal(node)
-        elif isinstance(node, NumberLiteralNode):
-            return self.visit_number_literal(node)
-        elif isinstance(node, PowerNode):
-            return self.visit_power(node)
-        elif isinstance(node, ForLoopNode):
-            return self.visit_for_loop(node)
-        elif isinstance(node, WhileLoopNode):
-            return self.visit_while_loop(node)
-        elif isinstance(node, ComparisonNode):
-            return self.visit_comparison(node)
-        elif isinstance(node, AssignmentNode):
-            return self.visit_assignment(node)
-        elif isinstance(node, FunctionCallNode):
-            return self.visit_function_call(node)
-        else:
-            raise NotImplementedError(f"Unsupported node type: {type(node)}")
+    def generic_visit(self, node):
+        raise NotImplementedError(f"Unsupported node type: {type(node)}")
 
-    def visit_program(self, node):
-        return "\n".join(self.visit(stmt) for stmt in node.statements)
+    def visit_ProgramNode(self, node):
+        self._out = []
+        for index, stmt in enumerate(node.statements):
+            if index:
+                self.emit("\n")
+            self._emit_statement(stmt)
+        return "".join(self._out)
+
+    def _emit_body(self, body):
+        for index, stmt in enumerate(body):
+            if index:
+                self.emit("\n")
+            self.emit("    ")
+            self._emit_statement(stmt)
 
-    def visit_function(self, node):
+    def visit_FunctionNode(self, node):
         args_str = ", ".join(node.args)
-        body = "\n".join("    " + self.visit(stmt) for stmt in node.body)
-        return f"def {node.name}({args_str}):\n{body}"
-
-    def visit_print(self, node):
-        expr = self.visit(node.expression)
-        # If the expression contains a variable, wrap it in str()
-        if isinstance(node.expression, VariableNode):
-            return f"print({expr})"
-        elif isinstance(node.expression, MathOpNode):
-            return f"print({expr})"
-        else:
-            return f"print({expr})"
+        self.emit(f"def {node.name}({args_str}):\n")
+        self._emit_body(node.body)
+
+    def visit_PrintNode(self, node):
+        self.emit(f"print({self.visit(node.expression)})")
 
-    def visit_math_op(self, node):
+    def visit_MathOpNode(self, node):
         left = self.visit(node.left)
         right = self.visit(node.right)
         # If either operand is a variable, wrap it in str()
@@ -248,34 +320,34 @@ class PythonGenerator(BaseGenerator):
             right = f"str({right})"
         return f"({left} {node.operator} {right})"
 
-    def visit_variable(self, node):
+    def visit_VariableNode(self, node):
         return node.name
 
-    def visit_string_literal(self, node):
+    def visit_StringLiteralNode(self, node):
         return f'"{node.value}"'
 
-    def visit_number_literal(self, node):
+    def visit_NumberLiteralNode(self, node):
         return node.value
 
-    def visit_power(self, node):
+    def visit_PowerNode(self, node):
         return f"({self.visit(node.base)} ** {self.visit(node.exponent)})"
 
-    def visit_for_loop(self, node):
+    def visit_ForLoopNode(self, node):
         # Format the for loop with proper spacing and indentation
-        body = "\n".join("    " + self.visit(stmt) for stmt in node.body)
-        return f"for {node.iterator} in {node.iterable}:\n{body}"
+        self.emit(f"for {node.iterator} in {node.iterable}:\n")
+        self._emit_body(node.body)
 
-    def visit_while_loop(self, node):
-        body = "\n".join("    " + self.visit(stmt) for stmt in node.body)
-        return f"while {self.visit(node.condition)}:\n{body}"
+    def visit_WhileLoopNode(self, node):
+        self.emit(f"while {self.visit(node.condition)}:\n")
+        self._emit_body(node.body)
 
-    def visit_comparison(self, node):
+    def visit_ComparisonNode(self, node):
         return f"({self.visit(node.left)} {node.operator} {self.visit(node.right)})"
 
-    def visit_assignment(self, node):
-        return f"{self.visit(node.target)} = {self.visit(node.value)}"
+    def visit_AssignmentNode(self, node):
+        self.emit(f"{self.visit(node.target)} = {self.visit(node.value)}")
 
-    def visit_function_call(self, node):
+    def visit_FunctionCallNode(self, node):
         args_str = ", ".join(self.visit(arg) for arg in node.args)
         return f"{node.name}({args_str})"
 
@@ -364,30 +436,32 @@ class CppGenerator(BaseGenerator):
 
     def visit_ForLoopNode(self, node):
         iterator = node.iterator
-        iterable = self.visit(node.iterable)
-        
-        # Convert Python range to C++ for loop
-        if isinstance(iterable, str) and iterable.startswith("range("):
-            # Parse range arguments
-            range_args = iterable[6:-1].split(',')
-            if len(range_args) == 1:
-                # range(n) -> for(int i = 0; i < n; i++)
-                end = range_args[0].strip()
-                header = f"{self._make_indent()}for (int {iterator} = 0; {iterator} < {end}; {iterator}++) {{"
-            elif len(range_args) == 2:
-                # range(start, end) -> for(int i = start; i < end; i++)
-                start = range_args[0].strip()
-                end = range_args[1].strip()
-                header = f"{self._make_indent()}for (int {iterator} = {start}; {iterator} < {end}; {iterator}++) {{"
-            else:
-                # range(start, end, step) -> for(int i = start; i < end; i += step)
-                start = range_args[0].strip()
-                end = range_args[1].strip()
-                step = range_args[2].strip()
-                header = f"{self._make_indent()}for (int {iterator} = {start}; {iterator} < {end}; {iterator} += {step}) {{"
+
+        if node.range_info:
+            # Structured range from the parser: no need to re-parse the iterable string
+            start, end, step = node.range_info
+            header = f"{self._make_indent()}for (int {iterator} = {start}; {iterator} < {end}; {iterator} += {step}) {{"
         else:
-            # For other iterables, use range-based for loop
-            header = f"{self._make_indent()}for (const auto& {iterator} : {iterable}) {{"
+            iterable = self.visit(node.iterable)
+            # Convert Python range to C++ for loop
+            if iterable.startswith("range("):
+                # Parse range arguments
+                range_args = [arg.strip() for arg in iterable[6:-1].split(',')]
+                if len(range_args) == 1:
+                    # range(n) -> for(int i = 0; i < n; i++)
+                    end = range_args[0]
+                    header = f"{self._make_indent()}for (int {iterator} = 0; {iterator} < {end}; {iterator}++) {{"
+                elif len(range_args) == 2:
+                    # range(start, end) -> for(int i = start; i < end; i++)
+                    start, end = range_args
+                    header = f"{self._make_indent()}for (int {iterator} = {start}; {iterator} < {end}; {iterator}++) {{"
+                else:
+                    # range(start, end, step) -> for(int i = start; i < end; i += step)
+                    start, end, step = range_args[:3]
+                    header = f"{self._make_indent()}for (int {iterator} = {start}; {iterator} < {end}; {iterator} += {step}) {{"
+            else:
+                # For other iterables, use range-based for loop
+                header = f"{self._make_indent()}for (const auto& {iterator} : {iterable}) {{"
         
         self.current_indent_level += 1
         # Process each statement in the body
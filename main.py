@@ -1,4 +1,5 @@
 # universal_code_converter/main.py
+import argparse
 import sys
 import os
 import time
@@ -15,29 +16,38 @@ if os.path.dirname(project_root) not in sys.path: # If inside universal_code_con
 # Use absolute imports
 from ast_module.universal_ast import ProgramNode # For type checking or inspection if needed
 from parsers.python_parser import parse_python
-from parsers.java_parser import JavaParser
+from parsers.java_parser import parse_java
 from parsers.cpp_parser import parse_cpp
 
 # Transformers (currently placeholders)
-from transformers.python_transformer import transform_to_python_ast
-from transformers.java_transformer import transform_to_java_ast
-from transformers.cpp_transformer import transform_to_cpp_ast
+from transformers.python_transformer import (
+    transform_to_python_ast, IDENTITY_TRANSFORM as PYTHON_IDENTITY_TRANSFORM
+)
+from transformers.java_transformer import (
+    transform_to_java_ast, IDENTITY_TRANSFORM as JAVA_IDENTITY_TRANSFORM
+)
+from transformers.cpp_transformer import (
+    transform_to_cpp_ast, IDENTITY_TRANSFORM as CPP_IDENTITY_TRANSFORM
+)
 
 from generators.base_generator import (
-    PythonGenerator, JavaGenerator, CppGenerator, JsGenerator
+    PythonGenerator, JavaGenerator, CppGenerator
 )
 
 PARSERS = {
     'python': parse_python,
-    'java': JavaParser,
+    'java': parse_java,
     'cpp': parse_cpp,
     
 }
 
+# A transformer module sets IDENTITY_TRANSFORM = True while its transform
+# is a pass-through; it maps to None here so the call is skipped. Set it
+# to False once the transformer really changes the AST.
 TRANSFORMERS = { # Currently placeholders
-    'python': transform_to_python_ast,
-    'java': transform_to_java_ast,
-    'cpp': transform_to_cpp_ast,
+    'python': None if PYTHON_IDENTITY_TRANSFORM else transform_to_python_ast,
+    'java': None if JAVA_IDENTITY_TRANSFORM else transform_to_java_ast,
+    'cpp': None if CPP_IDENTITY_TRANSFORM else transform_to_cpp_ast,
    
 }
 
@@ -69,13 +79,17 @@ def convert_code(source_code, source_lang, target_lang):
     if source_lang == 'python':
         ast = parse_python(source_code)
     elif source_lang == 'java':
-        java_parser = JavaParser()
-        ast = java_parser.parse_java(source_code)
+        ast = parse_java(source_code)
     elif source_lang == 'cpp':
         ast = parse_cpp(source_code)
     else:
         raise ValueError(f"Unsupported source language: {source_lang}")
 
+    # Apply the target language's transformer, unless it is a no-op
+    transformer = TRANSFORMERS.get(target_lang)
+    if transformer is not None:
+        ast = transformer(ast)
+
     # Generate target code from universal AST
     if target_lang == 'python':
         generator = PythonGenerator()
@@ -83,15 +97,22 @@ def convert_code(source_code, source_lang, target_lang):
         generator = JavaGenerator()
     elif target_lang == 'cpp':
         generator = CppGenerator()
-    elif target_lang == 'javascript':
-        generator = JsGenerator()
     else:
         raise ValueError(f"Unsupported target language: {target_lang}")
 
     return generator.visit(ast)
 
+def parse_args(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Universal Cross-Language Code Converter")
+    arg_parser.add_argument(
+        '--demo', action='store_true',
+        help="pause between conversion steps, for demonstrations"
+    )
+    return arg_parser.parse_args(argv)
+
 def main():
     """Main entry point for the code converter."""
+    args = parse_args()
     print(" _______________________________________________________")
     print("|Welcome to the Universal Cross-Language Code Converter!|")
     print(f"|Supported languages: {', '.join(SUPPORTED_LANGUAGES)}                 |")
@@ -118,23 +139,27 @@ def main():
         sys.exit(1)
 
     print("\nProcessing...")
-    delay(4)
+    if args.demo:
+        delay(4)
     try:
         # 1. Parse source code to Universal AST
-        if source_lang == 'java':
-            parser = JavaParser()
-            universal_ast = parser.parse_java(source_code)
-        else:
-            parser = PARSERS[source_lang]
-            print(f"Using {source_lang} parser...")
+        parser = PARSERS[source_lang]
+        print(f"Using {source_lang} parser...")
+        if args.demo:
             delay(3)
-            universal_ast = parser(source_code)
+        universal_ast = parser(source_code)
+
+        # 2. Apply the target language's transformer, unless it is a no-op
+        transformer = TRANSFORMERS[target_lang]
+        if transformer is not None:
+            universal_ast = transformer(universal_ast)
         
-        # 2. Generate target code from AST
+        # 3. Generate target code from AST
         generator_class = GENERATORS[target_lang]
         generator = generator_class()
         print(f"Using {target_lang} generator...")
-        delay(4)
+        if args.demo:
+            delay(4)
         target_code = generator.visit(universal_ast)
 
         print("\n<--- Converted Code --->")
@@ -0,0 +1,316 @@
+# universal_code_converter/parsers/_core.py
+"""Parser helpers shared by the language front ends.
+
+Every front end builds its expression parser with make_expression_parser(),
+passing its power-call regex and, for C++, its own string-literal rule.
+The Java and Python front ends also build their statement parser with
+make_block_parser() from a table of line patterns and handlers.
+"""
+import re
+import string
+import sys
+from functools import lru_cache
+from operator import sub
+from ast_module.universal_ast import (
+    ProgramNode, MathOpNode, VariableNode, StringLiteralNode, NumberLiteralNode,
+    PowerNode, WhileLoopNode, ComparisonNode, AssignmentNode, LazyBody
+)
+
+# Tokens the expression scanner has to look at: whole string/char literals
+# (so their contents are skipped), parentheses, commas and operators.
+# Multi-character tokens such as '<<', '++' and '->' are listed so that
+# their characters are never mistaken for '<', '+' or '>'.
+TOKEN_RE = re.compile(r'''"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|[(),]|==|!=|<=|>=|<<|>>|\+\+|\+=|->|[<>+]''')
+
+# Binary operator precedence: comparisons bind loosest, then '+'.
+BINARY_PRECEDENCE = {'==': 1, '!=': 1, '<=': 1, '>=': 1, '<': 1, '>': 1, '+': 2}
+# Any character that can start a binary operator; an expression without
+# one is a single operand and does not need the token scan at all.
+OPERATOR_CHAR_RE = re.compile(r"[=!<>+]")
+
+# Shared leaf nodes: recent occurrences of the same identifier, number or
+# string literal get the same (never mutated) node, whichever parser made
+# it. Bounded like the expression cache, so a long-running process does
+# not keep every leaf it has ever parsed.
+@lru_cache(maxsize=4096)
+def variable_node(name):
+    """Return the shared VariableNode for name."""
+    return VariableNode(name)
+
+@lru_cache(maxsize=4096)
+def number_node(value):
+    """Return the shared NumberLiteralNode for value."""
+    return NumberLiteralNode(value)
+
+@lru_cache(maxsize=4096)
+def string_literal(value):
+    """Return the shared StringLiteralNode for value (without its quotes)."""
+    return StringLiteralNode(value)
+
+def tokenize(expr_str, operators=BINARY_PRECEDENCE):
+    """Split an expression on top-level operators in a single left-to-right scan.
+
+    Returns [operand, operator, operand, ...] with stripped operands.
+    Operators inside string/char literals or parentheses are not split on.
+    """
+    tokens = []
+    depth = 0
+    operand_start = 0
+    for token_match in TOKEN_RE.finditer(expr_str):
+        token = token_match.group()
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        elif depth == 0 and token in operators:
+            tokens.append(expr_str[operand_start:token_match.start()].strip())
+            # match.group() returns a fresh string; interned, every node
+            # built from the same operator shares one copy of it
+            tokens.append(sys.intern(token))
+            operand_start = token_match.end()
+    tokens.append(expr_str[operand_start:].strip())
+    return tokens
+
+def find_closing_paren(args_str):
+    """Return the index of the ')' that closes a call whose arguments start args_str.
+
+    Parentheses inside string/char literals are skipped. args_str must end
+    with ')'; if no ')' closes the call early, that last one is taken.
+    """
+    depth = 0
+    for token_match in TOKEN_RE.finditer(args_str):
+        token = token_match.group()
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            if depth == 0:
+                return token_match.start()
+            depth -= 1
+    return len(args_str) - 1
+
+def quoted_string(expr_str):
+    """Return the StringLiteralNode for a '...' or "..." operand, else None."""
+    # One index test on each end, then the shared node
+    if len(expr_str) >= 2 and expr_str[0] in '"\'' and expr_str[-1] == expr_str[0]:
+        return string_literal(expr_str[1:-1])
+    return None
+
+def make_expression_parser(pow_re, parse_string=quoted_string):
+    """Build the expression parser for a language whose power call matches pow_re.
+
+    pow_re must capture the call's argument list as group 1. parse_string
+    returns the node for a string-literal operand, or None when the operand
+    is not one. Returns (parse_expression, parse_primary); each language
+    module binds them as its _parse_expression and _parse_primary.
+    """
+    def parse_binary(tokens, pos, min_precedence):
+        """Precedence-climbing parser over the operand/operator list from tokenize."""
+        left = parse_primary(tokens[pos])
+        pos += 1
+        while pos < len(tokens):
+            op = tokens[pos]
+            precedence = BINARY_PRECEDENCE[op]
+            if precedence < min_precedence:
+                break
+            right, pos = parse_binary(tokens, pos + 1, precedence + 1)
+            if precedence == 1:
+                left = ComparisonNode(op, left, right)
+            else:
+                left = MathOpNode(op, left, right)
+        return left, pos
+
+    def parse_expression(expr_str):
+        """Parse expressions including comparisons."""
+        return parse_expression_cached(expr_str.strip())
+
+    # Identical expressions (loop conditions, repeated operands, literals)
+    # recur throughout a program; nodes are never mutated after parsing, so
+    # one parse can be shared between all of its occurrences.
+    @lru_cache(maxsize=4096)
+    def parse_expression_cached(expr_str):
+        """Memoized worker for parse_expression; expr_str is already stripped."""
+        if not OPERATOR_CHAR_RE.search(expr_str):
+            return parse_primary(expr_str)
+        tokens = tokenize(expr_str)
+        # Operator tokens are never empty, so no need to slice out the operands
+        if '' in tokens:
+            # A dangling operator (e.g. unary '+'): not something we can split
+            return parse_primary(expr_str)
+        node, _ = parse_binary(tokens, 0, 1)
+        return node
+
+    def parse_primary(expr_str):
+        """Parse a single operand: power call, literal or variable."""
+        # Plain identifiers and numbers are by far the most common operands,
+        # so they are classified first, with str methods rather than regexes
+
+        # 1. Variable
+        if expr_str.isidentifier():
+            return variable_node(expr_str)
+
+        # 2. Number literal (integer or float): -?\d+(\.\d+)?
+        unsigned = expr_str[1:] if expr_str.startswith('-') else expr_str
+        whole, dot, fraction = unsigned.partition('.')
+        if whole.isdecimal() and (not dot or fraction.isdecimal()):
+            return number_node(expr_str)
+
+        # 3. Power function (Math.pow(a, b) / pow(a, b))
+        pow_match = pow_re.fullmatch(expr_str)
+        if pow_match:
+            # Like str.partition on the top-level comma: [base, ',', exponent]
+            args = tokenize(pow_match.group(1), (',',))
+            if len(args) == 3:
+                base, _, exponent = args
+                return PowerNode(parse_expression(base), parse_expression(exponent))
+
+        # 4. String literal
+        node = parse_string(expr_str)
+        if node is not None:
+            return node
+
+        # Fallback: treat as variable
+        return VariableNode(expr_str)
+
+    return parse_expression, parse_primary
+
+# C-style for loop -> range(): the comparison operator picks the (start, end)
+# bounds and the update operator the step. Table lookups rather than
+# if/elif chains; the loop regexes only ever capture these keys.
+OP_ADJUST = {
+    '<': lambda start, end: (start, end),
+    '<=': lambda start, end: (start, f"{end} + 1"),
+    '>': lambda start, end: (end, start),
+    '>=': lambda start, end: (start, end),
+}
+STEP_MAP = {
+    '++': lambda step_val: "1",
+    '--': lambda step_val: "-1",
+    '+=': lambda step_val: step_val,
+    '-=': lambda step_val: f"-{step_val}",
+}
+
+def get_indented_block(indents, stripped, start_idx, end_idx, base_indent):
+    """Helper to find the end of an indented block; returns the index past it."""
+    i = start_idx
+    while i < end_idx:
+        if stripped[i] and indents[i] <= base_indent and i > start_idx:
+            break
+        i += 1
+    return i
+
+def split_lines(code):
+    """Split source into per-line indent widths and stripped text.
+
+    The per-line work runs inside C builtins via map() rather than in
+    Python-level comprehension loops. Lines stay str: the regexes and the
+    AST need str, and lstrip()/rstrip() return the line itself when there
+    is nothing to strip, so unindented lines are not copied at all.
+    """
+    lines = code.splitlines()
+    # Each line is left-stripped once; that copy gives both the indent width
+    # and, after rstrip, the stripped text
+    lstripped = list(map(str.lstrip, lines))
+    indents = list(map(sub, map(len, lines), map(len, lstripped)))
+    stripped = list(map(str.rstrip, lstripped))
+    return indents, stripped
+
+# Characters a word-led statement (identifier, keyword, type name) can start with
+WORD_CHARS = string.ascii_letters + string.digits + '_'
+
+def make_block_parser(line_patterns, line_handlers, parse_expression):
+    """Build the statement parser for a front end with indented blocks.
+
+    line_patterns is a sequence of (possible first characters, pattern)
+    pairs, in the order the alternatives are tried. Each pattern is wrapped
+    in an outer named group; the group name (match.lastgroup) selects the
+    pattern's handler in line_handlers.
+
+    A handler is called as handler(match, i, block_end, statements,
+    open_body) for a match on line i. It appends its statement and returns
+    the index of the next line to parse. A statement with a body gets it,
+    and the index past it, from open_body(i, block_end).
+
+    The 'assign' (assign_target, assign_value) and 'while'
+    (while_condition) statements are handled here, with parse_expression,
+    unless line_handlers overrides them.
+
+    Returns parse_program(code, lazy=False), which returns a ProgramNode.
+    """
+    def parse_assignment(match, i, block_end, statements, open_body):
+        statements.append(AssignmentNode(
+            variable_node(match.group('assign_target')),
+            parse_expression(match.group('assign_value'))
+        ))
+        return i + 1
+
+    def parse_while_loop(match, i, block_end, statements, open_body):
+        condition = parse_expression(match.group('while_condition'))
+        body, body_end = open_body(i, block_end)
+        statements.append(WhileLoopNode(condition, body))
+        return body_end
+
+    handlers = {'assign': parse_assignment, 'while': parse_while_loop}
+    handlers.update(line_handlers)
+
+    def fuse_patterns(first_char=None):
+        """Compile the patterns that can start with first_char into one alternation.
+
+        With first_char None every pattern is included. Returns None when
+        no pattern can match.
+        """
+        patterns = [pattern for first_chars, pattern in line_patterns
+                    if first_char is None or first_char in first_chars]
+        return re.compile("|".join(patterns)) if patterns else None
+
+    # First character of a stripped line -> one fused regex over just the
+    # statement forms that can start with it, so each line is matched once.
+    # Only ASCII is tabulated; any other character (e.g. a Unicode
+    # identifier) uses the alternation of every pattern. Characters no
+    # pattern starts with, such as comment markers, map to None, as do
+    # blank lines ('').
+    line_re = fuse_patterns()
+    line_dispatch = {char: fuse_patterns(char) for char in map(chr, range(128))}
+    line_dispatch[''] = None
+
+    def parse_block(indents, stripped, block_start, block_end, lazy=False):
+        """Parse source lines [block_start, block_end) into a list of statement nodes.
+
+        Nested bodies are taken from an explicit work stack instead of
+        recursing, so nesting depth costs neither Python frames nor the
+        recursion limit. With lazy=True they are left as LazyBody objects.
+        """
+        root = []
+        pending = [(root, block_start, block_end)]
+
+        def open_body(i, end):
+            """Return (body, index past it) for the block indented under line i."""
+            body_start = i + 1
+            body_end = get_indented_block(indents, stripped, body_start, end, indents[i])
+            if lazy:
+                body = LazyBody(parse_block, indents, stripped, body_start, body_end, True)
+            else:
+                # Filled in when the work loop below pops its frame
+                body = []
+                pending.append((body, body_start, body_end))
+            return body, body_end
+
+        while pending:
+            statements, i, end = pending.pop()
+            while i < end:
+                line = stripped[i]
+                dispatch_re = line_dispatch.get(line[:1], line_re)
+                line_match = dispatch_re.match(line) if dispatch_re is not None else None
+                if line_match:
+                    handler = handlers[line_match.lastgroup]
+                    i = handler(line_match, i, end, statements, open_body)
+                else:
+                    i += 1
+
+        return root
+
+    def parse_program(code, lazy=False):
+        """Parse source code into a ProgramNode (see make_block_parser)."""
+        indents, stripped = split_lines(code)
+        return ProgramNode(parse_block(indents, stripped, 0, len(stripped), lazy))
+
+    return parse_program
@@ -1,139 +1,155 @@
 # universal_code_converter/parsers/cpp_parser.py
 import re
+import sys
+from functools import lru_cache
 from ast_module.universal_ast import (
     ProgramNode, FunctionNode, PrintNode, MathOpNode,
-    VariableNode, StringLiteralNode, NumberLiteralNode, PowerNode,
-    ForLoopNode, WhileLoopNode, ComparisonNode, AssignmentNode
+    ForLoopNode, WhileLoopNode, AssignmentNode
+)
+from parsers._core import (
+    OP_ADJUST, STEP_MAP, get_indented_block, make_expression_parser, split_lines,
+    string_literal, tokenize, variable_node
 )
 
-# Regex patterns for C++ syntax
-FUNC_DEF_REGEX = r"(?:void|int|string)\s+(\w+)\s*\(([^)]*)\)\s*\{"
-# Updated PRINT_REGEX to better handle string literals and expressions
-PRINT_REGEX = r"(?:std::)?cout\s*<<\s*([^;]+)(?:\s*<<\s*endl)?"
-MATH_OP_REGEX = r"(.+?)\s*\+\s*(.+)"
-POW_REGEX = r"pow\s*\(([^,]+)\s*,\s*([^)]+)\)"
-# Updated FOR_LOOP_REGEX to handle more patterns
-FOR_LOOP_REGEX = r"for\s*\(\s*(?:int\s+)?(\w+)\s*=\s*([^;]+);\s*\1\s*(<|<=|>|>=)\s*([^;]+);\s*\1\s*(\+\+|--|\+=|-=)\s*([^)]*)\)\s*\{"
-WHILE_LOOP_REGEX = r"while\s*\((.*?)\)\s*\{"
-COMPARISON_REGEX = r"(.+?)\s*(==|!=|<=|>=|<|>)\s*(.+)"
-ASSIGNMENT_REGEX = r"(?:int\s+)?(\w+)\s*=\s*(.+)"
+# Regex patterns for C++ syntax, compiled once at import
+POW_RE = re.compile(r"pow\s*\((.*)\)")
+
+# Statement patterns, fused into a single alternation so that each line
+# is matched once; the outer group name (match.lastgroup) selects the
+# handler in LINE_HANDLERS. Alternatives are tried in this order.
+ASSIGNMENT_PATTERN = r"(?P<assign>(?:int\s+)?(?P<assign_target>\w+)\s*=\s*(?P<assign_value>.+))"
+FUNC_DEF_PATTERN = r"(?P<func>(?:void|int|string)\s+(?P<func_name>\w+)\s*\((?P<func_args>[^)]*)\)\s*\{)"
+# Updated FOR_LOOP_PATTERN to handle more patterns
+FOR_LOOP_PATTERN = (
+    r"(?P<for>for\s*\(\s*(?:int\s+)?(?P<for_iterator>\w+)\s*=\s*(?P<for_start>[^;]+);"
+    r"\s*(?P=for_iterator)\s*(?P<for_op><|<=|>|>=)\s*(?P<for_end>[^;]+);"
+    r"\s*(?P=for_iterator)\s*(?P<for_step_op>\+\+|--|\+=|-=)\s*(?P<for_step_val>[^)]*)\)\s*\{)"
+)
+WHILE_LOOP_PATTERN = r"(?P<while>while\s*\((?P<while_condition>.*?)\)\s*\{)"
+# Updated PRINT_PATTERN to better handle string literals and expressions
+PRINT_PATTERN = r"(?P<print>(?:std::)?cout\s*<<\s*(?P<print_expression>[^;]+)(?:\s*<<\s*endl)?)"
+LINE_RE = re.compile("|".join([
+    ASSIGNMENT_PATTERN, FUNC_DEF_PATTERN, FOR_LOOP_PATTERN, WHILE_LOOP_PATTERN, PRINT_PATTERN
+]))
+
+# C++ escape sequences: hex (any length), octal (up to three digits),
+# universal character names, or one escaped character
+ESCAPE_RE = re.compile(r"\\(?:x([0-9A-Fa-f]+)|([0-7]{1,3})|u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))", re.DOTALL)
+SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'a': '\a', 'b': '\b', 'f': '\f', 'v': '\v',
+    '\\': '\\', '"': '"', "'": "'", '?': '?',
+}
+
+def _decode_escape(match):
+    hex_digits, octal_digits, short_ucn, long_ucn, char = match.groups()
+    if char is not None:
+        # An escape C++ does not define is kept as written
+        return SIMPLE_ESCAPES.get(char, match.group())
+    code_point = int(octal_digits, 8) if octal_digits else int(hex_digits or short_ucn or long_ucn, 16)
+    if code_point > sys.maxunicode:
+        return match.group()
+    return chr(code_point)
 
 def _parse_string_literal(expr_str):
-    """Parse C++ string literals, handling escape sequences."""
-    if not (expr_str.startswith('"') and expr_str.endswith('"')):
-        return expr_str
-    
+    """Parse a quoted C++ string literal, decoding its escape sequences."""
     # Remove the surrounding quotes
     content = expr_str[1:-1]
-    
-    # Handle common escape sequences
-    escape_map = {
-        r'\"': '"',
-        r'\n': '\n',
-        r'\t': '\t',
-        r'\\': '\\'
-    }
-    
-    for escaped, unescaped in escape_map.items():
-        content = content.replace(escaped, unescaped)
-    
-    return content
-
-def _parse_expression(expr_str):
-    """Parse expressions including comparisons."""
-    expr_str = expr_str.strip()
-
-    # Check for comparison operators
-    for op in ['==', '!=', '<=', '>=', '<', '>']:
-        if f" {op} " in expr_str:
-            parts = expr_str.split(f" {op} ", 1)
-            if len(parts) == 2:
-                left = _parse_expression(parts[0].strip())
-                right = _parse_expression(parts[1].strip())
-                return ComparisonNode(op, left, right)
-
-    # 1. Power function (pow(a, b))
-    pow_match = re.fullmatch(POW_REGEX, expr_str)
-    if pow_match:
-        base = _parse_expression(pow_match.group(1).strip())
-        exponent = _parse_expression(pow_match.group(2).strip())
-        return PowerNode(base, exponent)
-
-    # 2. Simple addition (a + b)
-    if ' + ' in expr_str and not expr_str.startswith("pow("):
-        parts = expr_str.split(' + ', 1)
-        if len(parts) == 2:
-            left = _parse_expression(parts[0].strip())
-            right = _parse_expression(parts[1].strip())
-            return MathOpNode('+', left, right)
-
-    # 3. String literal
-    if (expr_str.startswith('"') and expr_str.endswith('"')):
-        return StringLiteralNode(_parse_string_literal(expr_str))
-
-    # 4. Number literal (integer or float)
-    if re.fullmatch(r"-?\d+(\.\d+)?", expr_str):
-        return NumberLiteralNode(expr_str)
-
-    # 5. Variable
-    if re.fullmatch(r"[a-zA-Z_]\w*", expr_str):
-        return VariableNode(expr_str)
-
-    # Fallback: treat as variable
-    return VariableNode(expr_str)
-
-def _get_indented_block(lines, start_idx, base_indent):
-    """Helper to get indented block of code."""
-    block_lines = []
-    i = start_idx
-    while i < len(lines):
-        line = lines[i]
-        if not line.strip():
-            i += 1
-            continue
-        indent = len(line) - len(line.lstrip())
-        if indent <= base_indent and i > start_idx:
-            break
-        block_lines.append(line)
-        i += 1
-    return block_lines, i
+    if '\\' not in content:
+        return content
+    # A trailing lone backslash matches nothing and is kept as written
+    return ESCAPE_RE.sub(_decode_escape, content)
 
-def _convert_cpp_for_to_range(start, end, operator, step_op, step_val):
-    """Convert C++ for loop parameters to Python range parameters."""
-    start = start.strip()
-    end = end.strip()
-    
-    # Handle different comparison operators
-    if operator == '<=':
-        end = f"{end} + 1"
-    elif operator == '>':
-        start, end = end, start
-        if step_op == '++':
-            step_val = "-1"
-        elif step_op == '--':
-            step_val = "1"
-    
-    # Handle step value
-    if step_op == '++':
-        step = "1"
-    elif step_op == '--':
-        step = "-1"
-    elif step_op == '+=':
-        step = step_val
-    elif step_op == '-=':
-        step = f"-{step_val}"
-    
-    return f"range({start}, {end}, {step})"
+def _string_node(expr_str):
+    """Return the StringLiteralNode for a "..." operand, escapes decoded, else None."""
+    if expr_str.startswith('"') and expr_str.endswith('"'):
+        return string_literal(_parse_string_literal(expr_str))
+    return None
 
-def parse_cpp(code):
+_parse_expression, _ = make_expression_parser(POW_RE, _string_node)
+
+def _split_cout_chain(expr_str):
+    """Split a cout expression on its top-level '<<' operators in one pass.
+
+    '<<' inside string/char literals or parentheses is left alone.
     """
-    Parse C++ code into a universal AST.
+    return tokenize(expr_str, ('<<',))[::2]
+
+# Loop headers repeat a lot (0, n, <, ++); the result is an immutable
+# (str, tuple) pair, so it can be cached on the raw regex groups
+@lru_cache(maxsize=512)
+def _convert_cpp_for_to_range(start, end, operator, step_op, step_val):
+    """
+    Convert C++ for loop parameters to Python range parameters.
+    Returns the range(...) expression and its (start, end, step) parts.
     """
+    start, end = OP_ADJUST[operator](start.strip(), end.strip())
+    step = STEP_MAP[step_op](step_val)
+    return f"range({start}, {end}, {step})", (start, end, step)
+
+# Line handlers: each takes the LINE_RE match for line i, appends its
+# statement and returns the index of the next line to parse.
+
+def _parse_assignment(match, indents, stripped, i, block_end, statements):
+    statements.append(AssignmentNode(
+        variable_node(match.group('assign_target')),
+        _parse_expression(match.group('assign_value'))
+    ))
+    return i + 1
+
+def _parse_function(match, indents, stripped, i, block_end, statements):
+    name = match.group('func_name')
+    args_str = match.group('func_args')
+    args = [arg.strip().split()[-1] for arg in args_str.split(',') if arg.strip()]
+
+    body_start = i + 1
+    body_end = get_indented_block(indents, stripped, body_start, block_end, indents[i])
+    statements.append(FunctionNode(name, args, _parse_block(indents, stripped, body_start, body_end)))
+    return body_end
+
+def _parse_for_loop(match, indents, stripped, i, block_end, statements):
+    iterator = sys.intern(match.group('for_iterator'))
+    iterable, range_info = _convert_cpp_for_to_range(
+        match.group('for_start'), match.group('for_end'), match.group('for_op'),
+        match.group('for_step_op'), match.group('for_step_val')
+    )
+
+    body_start = i + 1
+    body_end = get_indented_block(indents, stripped, body_start, block_end, indents[i])
+    body = _parse_block(indents, stripped, body_start, body_end)
+    statements.append(ForLoopNode(iterator, iterable, body, range_info))
+    return body_end
+
+def _parse_while_loop(match, indents, stripped, i, block_end, statements):
+    condition = _parse_expression(match.group('while_condition'))
+
+    body_start = i + 1
+    body_end = get_indented_block(indents, stripped, body_start, block_end, indents[i])
+    statements.append(WhileLoopNode(condition, _parse_block(indents, stripped, body_start, body_end)))
+    return body_end
+
+def _parse_print(match, indents, stripped, i, block_end, statements):
+    # Handle multiple << operators in cout by folding them into '+'
+    parts = _split_cout_chain(match.group('print_expression').strip())
+    expression_node = _parse_expression(parts[0])
+    for part in parts[1:]:
+        expression_node = MathOpNode('+', expression_node, _parse_expression(part))
+    statements.append(PrintNode(expression_node))
+    return i + 1
+
+LINE_HANDLERS = {
+    'assign': _parse_assignment,
+    'func': _parse_function,
+    'for': _parse_for_loop,
+    'while': _parse_while_loop,
+    'print': _parse_print,
+}
+
+def _parse_block(indents, stripped, block_start, block_end):
+    """Parse source lines [block_start, block_end) into a list of statement nodes."""
     statements = []
-    lines = code.strip().split('\n')
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    i = block_start
+    while i < block_end:
+        line = stripped[i]
 
         if not line or line.startswith("//"):  # Skip empty lines and comments
             i += 1
@@ -144,76 +160,19 @@ def parse_cpp(code):
             i += 1
             continue
 
-        # Assignment
-        assign_match = re.match(ASSIGNMENT_REGEX, line)
-        if assign_match:
-            target = assign_match.group(1)
-            value = assign_match.group(2)
-            statements.append(AssignmentNode(
-                VariableNode(target),
-                _parse_expression(value)
-            ))
-            i += 1
-            continue
-
-        # Function definition
-        func_match = re.match(FUNC_DEF_REGEX, line)
-        if func_match:
-            name = func_match.group(1)
-            args_str = func_match.group(2)
-            args = [arg.strip().split()[-1] for arg in args_str.split(',') if arg.strip()]
-            
-            base_indent = len(lines[i]) - len(lines[i].lstrip())
-            body_lines, i = _get_indented_block(lines, i + 1, base_indent)
-            body_program = parse_cpp('\n'.join(body_lines))
-            statements.append(FunctionNode(name, args, body_program.statements))
-            continue
-
-        # For loop
-        for_match = re.match(FOR_LOOP_REGEX, line)
-        if for_match:
-            iterator = for_match.group(1)
-            start = for_match.group(2)
-            operator = for_match.group(3)
-            end = for_match.group(4)
-            step_op = for_match.group(5)
-            step_val = for_match.group(6)
-            
-            iterable = _convert_cpp_for_to_range(start, end, operator, step_op, step_val)
-            
-            base_indent = len(lines[i]) - len(lines[i].lstrip())
-            body_lines, i = _get_indented_block(lines, i + 1, base_indent)
-            body_program = parse_cpp('\n'.join(body_lines))
-            statements.append(ForLoopNode(iterator, iterable, body_program.statements))
-            continue
-
-        # While loop
-        while_match = re.match(WHILE_LOOP_REGEX, line)
-        if while_match:
-            condition = _parse_expression(while_match.group(1))
-            
-            base_indent = len(lines[i]) - len(lines[i].lstrip())
-            body_lines, i = _get_indented_block(lines, i + 1, base_indent)
-            body_program = parse_cpp('\n'.join(body_lines))
-            statements.append(WhileLoopNode(condition, body_program.statements))
-            continue
-
-        # Print statement
-        print_match = re.match(PRINT_REGEX, line)
-        if print_match:
-            expression_str = print_match.group(1).strip()
-            # Handle multiple << operators in cout
-            if '<<' in expression_str:
-                parts = [part.strip() for part in expression_str.split('<<')]
-                # Combine all parts with + operator
-                combined = ' + '.join(parts)
-                expression_node = _parse_expression(combined)
-            else:
-                expression_node = _parse_expression(expression_str)
-            statements.append(PrintNode(expression_node))
-            i += 1
+        line_match = LINE_RE.match(line)
+        if line_match:
+            handler = LINE_HANDLERS[line_match.lastgroup]
+            i = handler(line_match, indents, stripped, i, block_end, statements)
             continue
 
         i += 1
 
-    return ProgramNode(statements)
+    return statements
+
+def parse_cpp(code):
+    """
+    Parse C++ code into a universal AST.
+    """
+    indents, stripped = split_lines(code)
+    return ProgramNode(_parse_block(indents, stripped, 0, len(stripped)))
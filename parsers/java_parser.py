@@ -1,186 +1,123 @@
 # universal_code_converter/parsers/java_parser.py
 import re
-from ast_module.universal_ast import (
-    ProgramNode, FunctionNode, PrintNode, MathOpNode,
-    VariableNode, StringLiteralNode, NumberLiteralNode, PowerNode,
-    ForLoopNode, WhileLoopNode, ComparisonNode, AssignmentNode
+from functools import lru_cache
+from ast_module.universal_ast import FunctionNode, PrintNode, ForLoopNode
+from parsers._core import (
+    OP_ADJUST, STEP_MAP, WORD_CHARS, find_closing_paren, make_block_parser, make_expression_parser,
+    string_literal
 )
 
-# Regex patterns for Java syntax
-FUNC_DEF_REGEX = r"(?:public\s+)?(?:static\s+)?(?:void|int|String)\s+(\w+)\s*\(([^)]*)\)\s*\{"
-PRINT_REGEX = r"System\.out\.println\s*\((.*)\)"
-MATH_OP_REGEX = r"(.+?)\s*\+\s*(.+)"
-POW_REGEX = r"Math\.pow\s*\(([^,]+)\s*,\s*([^)]+)\)"
-# Updated FOR_LOOP_REGEX to handle more patterns
-FOR_LOOP_REGEX = r"for\s*\(\s*(?:int\s+)?(\w+)\s*=\s*([^;]+);\s*\1\s*(<|<=|>|>=)\s*([^;]+);\s*\1\s*(\+\+|--|\+=|-=)\s*([^)]*)\)\s*\{"
-WHILE_LOOP_REGEX = r"while\s*\((.*?)\)\s*\{"
-COMPARISON_REGEX = r"(.+?)\s*(==|!=|<=|>=|<|>)\s*(.+)"
-ASSIGNMENT_REGEX = r"(?:int\s+)?(\w+)\s*=\s*(.+)"
-
-def _parse_expression(expr_str):
-    """Parse expressions including comparisons."""
-    expr_str = expr_str.strip()
-
-    # Check for comparison operators
-    for op in ['==', '!=', '<=', '>=', '<', '>']:
-        if f" {op} " in expr_str:
-            parts = expr_str.split(f" {op} ", 1)
-            if len(parts) == 2:
-                left = _parse_expression(parts[0].strip())
-                right = _parse_expression(parts[1].strip())
-                return ComparisonNode(op, left, right)
-
-    # 1. Power function (Math.pow(a, b))
-    pow_match = re.fullmatch(POW_REGEX, expr_str)
-    if pow_match:
-        base = _parse_expression(pow_match.group(1).strip())
-        exponent = _parse_expression(pow_match.group(2).strip())
-        return PowerNode(base, exponent)
-
-    # 2. Simple addition (a + b)
-    if ' + ' in expr_str and not expr_str.startswith("Math.pow("):
-        parts = expr_str.split(' + ', 1)
-        if len(parts) == 2:
-            left = _parse_expression(parts[0].strip())
-            right = _parse_expression(parts[1].strip())
-            return MathOpNode('+', left, right)
-
-    # 3. String literal
-    if (expr_str.startswith('"') and expr_str.endswith('"')) or \
-       (expr_str.startswith("'") and expr_str.endswith("'")):
-        return StringLiteralNode(expr_str[1:-1])
-
-    # 4. Number literal (integer or float)
-    if re.fullmatch(r"-?\d+(\.\d+)?", expr_str):
-        return NumberLiteralNode(expr_str)
-
-    # 5. Variable
-    if re.fullmatch(r"[a-zA-Z_]\w*", expr_str):
-        return VariableNode(expr_str)
-
-    # Fallback: treat as variable
-    return VariableNode(expr_str)
-
-def _get_indented_block(lines, start_idx, base_indent):
-    """Helper to get indented block of code."""
-    block_lines = []
-    i = start_idx
-    while i < len(lines):
-        line = lines[i]
-        if not line.strip():
-            i += 1
-            continue
-        indent = len(line) - len(line.lstrip())
-        if indent <= base_indent and i > start_idx:
-            break
-        block_lines.append(line)
-        i += 1
-    return block_lines, i
-
+# Regex patterns for Java syntax, compiled once at import
+POW_RE = re.compile(r"Math\.pow\s*\((.*)\)")
+
+# Java statement patterns; the outer group name selects the handler
+ASSIGNMENT_PATTERN = r"(?P<assign>(?:int\s+)?(?P<assign_target>\w+)\s*=\s*(?P<assign_value>.+))"
+FUNC_DEF_PATTERN = r"(?P<func>(?:public\s+)?(?:static\s+)?(?:void|int|String)\s+(?P<func_name>\w+)\s*\((?P<func_args>[^)]*)\)\s*\{)"
+# Updated FOR_LOOP_PATTERN to handle more patterns
+FOR_LOOP_PATTERN = (
+    r"(?P<for>for\s*\(\s*(?:int\s+)?(?P<for_iterator>\w+)\s*=\s*(?P<for_start>[^;]+);"
+    r"\s*(?P=for_iterator)\s*(?P<for_op><|<=|>|>=)\s*(?P<for_end>[^;]+);"
+    r"\s*(?P=for_iterator)\s*(?P<for_step_op>\+\+|--|\+=|-=)\s*(?P<for_step_val>[^)]*)\)\s*\{)"
+)
+WHILE_LOOP_PATTERN = r"(?P<while>while\s*\((?P<while_condition>.*?)\)\s*\{)"
+# The common print arguments are recognised by the pattern itself: a plain
+# string literal, a number or an identifier. Anything else is captured up
+# to the last ')' and cut at the call's own closing parenthesis by the
+# handler, since a regex cannot balance parentheses.
+PRINT_PATTERN = (
+    r'(?P<print>System\.out\.println\s*\(\s*(?:(?:"(?P<print_string>[^"]*)"|(?P<print_number>-?\d+(?:\.\d+)?)'
+    r'|(?P<print_variable>[A-Za-z_]\w*))\s*\)|(?P<print_expression>.*\))))'
+)
+# Parameter names: the last word of each "Type name" entry, before a comma
+# or the end (C-style array brackets such as "int a[]" are skipped)
+PARAM_NAME_RE = re.compile(r"(\w+)[\s\[\]]*(?:,|$)")
+# An innermost generic argument list such as <K, V>; its commas do not
+# separate parameters
+GENERIC_ARGS_RE = re.compile(r"<[^<>]*>")
+
+_parse_expression, _parse_primary = make_expression_parser(POW_RE)
+
+# Loop headers repeat a lot (0, n, <, ++); the result is an immutable
+# (str, tuple) pair, so it can be cached on the raw regex groups
+@lru_cache(maxsize=512)
 def _convert_java_for_to_range(start, end, operator, step_op, step_val):
-    """Convert Java for loop parameters to Python range parameters."""
-    start = start.strip()
-    end = end.strip()
-    
-    # Handle different comparison operators
-    if operator == '<=':
-        end = f"{end} + 1"
-    elif operator == '>':
-        start, end = end, start
-        if step_op == '++':
-            step_val = "-1"
-        elif step_op == '--':
-            step_val = "1"
-    
-    # Handle step value
-    if step_op == '++':
-        step = "1"
-    elif step_op == '--':
-        step = "-1"
-    elif step_op == '+=':
-        step = step_val
-    elif step_op == '-=':
-        step = f"-{step_val}"
-    
-    return f"range({start}, {end}, {step})"
-
-def parse_java(code):
     """
-    Parse Java code into a universal AST.
+    Convert Java for loop parameters to Python range parameters.
+    Returns the range(...) expression and its (start, end, step) parts.
     """
-    statements = []
-    lines = code.strip().split('\n')
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        if not line or line.startswith("//"):  # Skip empty lines and comments
-            i += 1
-            continue
-
-        # Assignment
-        assign_match = re.match(ASSIGNMENT_REGEX, line)
-        if assign_match:
-            target = assign_match.group(1)
-            value = assign_match.group(2)
-            statements.append(AssignmentNode(
-                VariableNode(target),
-                _parse_expression(value)
-            ))
-            i += 1
-            continue
-
-        # Function definition
-        func_match = re.match(FUNC_DEF_REGEX, line)
-        if func_match:
-            name = func_match.group(1)
-            args_str = func_match.group(2)
-            args = [arg.strip().split()[-1] for arg in args_str.split(',') if arg.strip()]
-            
-            base_indent = len(lines[i]) - len(lines[i].lstrip())
-            body_lines, i = _get_indented_block(lines, i + 1, base_indent)
-            body_program = parse_java('\n'.join(body_lines))
-            statements.append(FunctionNode(name, args, body_program.statements))
-            continue
-
-        # For loop
-        for_match = re.match(FOR_LOOP_REGEX, line)
-        if for_match:
-            iterator = for_match.group(1)
-            start = for_match.group(2)
-            operator = for_match.group(3)
-            end = for_match.group(4)
-            step_op = for_match.group(5)
-            step_val = for_match.group(6)
-            
-            iterable = _convert_java_for_to_range(start, end, operator, step_op, step_val)
-            
-            base_indent = len(lines[i]) - len(lines[i].lstrip())
-            body_lines, i = _get_indented_block(lines, i + 1, base_indent)
-            body_program = parse_java('\n'.join(body_lines))
-            statements.append(ForLoopNode(iterator, iterable, body_program.statements))
-            continue
-
-        # While loop
-        while_match = re.match(WHILE_LOOP_REGEX, line)
-        if while_match:
-            condition = _parse_expression(while_match.group(1))
-            
-            base_indent = len(lines[i]) - len(lines[i].lstrip())
-            body_lines, i = _get_indented_block(lines, i + 1, base_indent)
-            body_program = parse_java('\n'.join(body_lines))
-            statements.append(WhileLoopNode(condition, body_program.statements))
-            continue
+    start, end = OP_ADJUST[operator](start.strip(), end.strip())
+    step = STEP_MAP[step_op](step_val)
+    return f"range({start}, {end}, {step})", (start, end, step)
+
+def _parameter_names(args_str):
+    """Return the parameter names declared in a Java parameter list."""
+    # Drop generic arguments innermost first, so Map<K, List<V>> m is
+    # left as Map m before the names are picked out
+    while '<' in args_str:
+        args_str, count = GENERIC_ARGS_RE.subn('', args_str)
+        if not count:
+            break  # An unmatched '<'
+    return PARAM_NAME_RE.findall(args_str)
+
+def _parse_function(match, i, block_end, statements, open_body):
+    name = match.group('func_name')
+    args_str = match.group('func_args')
+    args = _parameter_names(args_str)
+
+    body, body_end = open_body(i, block_end)
+    statements.append(FunctionNode(name, args, body))
+    return body_end
+
+def _parse_for_loop(match, i, block_end, statements, open_body):
+    iterator = match.group('for_iterator')
+    iterable, range_info = _convert_java_for_to_range(
+        match.group('for_start'), match.group('for_end'), match.group('for_op'),
+        match.group('for_step_op'), match.group('for_step_val')
+    )
+
+    body, body_end = open_body(i, block_end)
+    statements.append(ForLoopNode(iterator, iterable, body, range_info))
+    return body_end
+
+def _parse_print(match, i, block_end, statements, open_body):
+    string_value, number, name, expression_str = match.group(
+        'print_string', 'print_number', 'print_variable', 'print_expression'
+    )
+    if string_value is not None:
+        expression_node = string_literal(string_value)
+    elif expression_str is None:
+        # Number or identifier: a single leaf, straight to its interned node
+        expression_node = _parse_primary(number or name)
+    else:
+        expression_str = expression_str[:find_closing_paren(expression_str)]
+        expression_node = _parse_expression(expression_str)
+    statements.append(PrintNode(expression_node))
+    return i + 1
+
+LINE_HANDLERS = {
+    'func': _parse_function,
+    'for': _parse_for_loop,
+    'print': _parse_print,
+}
+
+# (possible first characters, pattern) for each statement form, in the
+# order the alternatives are tried. No pattern starts with "/", so comment
+# lines are skipped without a match attempt.
+LINE_PATTERNS = (
+    (WORD_CHARS, ASSIGNMENT_PATTERN),
+    ('psviS', FUNC_DEF_PATTERN),  # public/static/void/int/String
+    ('f', FOR_LOOP_PATTERN),
+    ('w', WHILE_LOOP_PATTERN),
+    ('S', PRINT_PATTERN),
+)
 
-        # Print statement
-        print_match = re.match(PRINT_REGEX, line)
-        if print_match:
-            expression_str = print_match.group(1).strip()
-            expression_node = _parse_expression(expression_str)
-            statements.append(PrintNode(expression_node))
-            i += 1
-            continue
+_parse_program = make_block_parser(LINE_PATTERNS, LINE_HANDLERS, _parse_expression)
 
-        i += 1
+def parse_java(code, lazy=False):
+    """
+    Parse Java code into a universal AST.
 
-    return ProgramNode(statements)
+    With lazy=True, function and loop bodies are parsed only when they are
+    first iterated (see LazyBody).
+    """
+    return _parse_program(code, lazy)
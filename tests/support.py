@@ -0,0 +1,30 @@
+# universal_code_converter/tests/support.py
+"""Helpers shared by the front-end tests.
+
+The golden files record what the converter produces today, warts and all:
+they pin behaviour so refactors can be checked against it, they are not a
+statement of what correct output would be. After an intended output
+change, write the new output over the affected tests/golden/*.txt file.
+"""
+import os
+
+from main import convert_code
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), 'golden')
+TARGET_LANGUAGES = ('python', 'java', 'cpp')
+
+def read_golden(name):
+    with open(os.path.join(GOLDEN_DIR, name), encoding='utf-8') as golden_file:
+        return golden_file.read()
+
+def assert_matches_golden(test_case, source_lang):
+    """Convert <source_lang>_source.txt to every target and compare with its golden."""
+    source = read_golden(f'{source_lang}_source.txt')
+    for target_lang in TARGET_LANGUAGES:
+        with test_case.subTest(target=target_lang):
+            expected = read_golden(f'{source_lang}_to_{target_lang}.txt')
+            test_case.assertEqual(convert_code(source, source_lang, target_lang) + '\n', expected)
+
+def assert_same_tree(test_case, actual, expected):
+    """Nodes compare by identity, so compare their field-by-field reprs."""
+    test_case.assertEqual(repr(actual), repr(expected))
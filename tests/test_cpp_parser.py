@@ -0,0 +1,103 @@
+# universal_code_converter/tests/test_cpp_parser.py
+import unittest
+import warnings
+
+from ast_module.universal_ast import (
+    ProgramNode, FunctionNode, PrintNode, MathOpNode, VariableNode,
+    StringLiteralNode, NumberLiteralNode, PowerNode, ForLoopNode,
+    WhileLoopNode, ComparisonNode
+)
+from parsers.cpp_parser import parse_cpp, _parse_string_literal
+from tests.support import assert_matches_golden, assert_same_tree
+
+class CppGoldenTest(unittest.TestCase):
+    def test_conversions_match_golden(self):
+        assert_matches_golden(self, 'cpp')
+
+class CppParserTest(unittest.TestCase):
+    def test_nested_blocks(self):
+        source = (
+            "#include <iostream>\n"
+            "int f(int a) {\n"
+            "    for (int i = 0; i < 3; i++) {\n"
+            "        while (a > 1) {\n"
+            "            cout << a;\n"
+            "        }\n"
+            "        cout << i;\n"
+            "    }\n"
+            "    // comment\n"
+            "    cout << a;\n"
+            "}\n"
+        )
+        a, i = VariableNode('a'), VariableNode('i')
+        assert_same_tree(self, parse_cpp(source), ProgramNode([
+            FunctionNode('f', ['a'], [
+                ForLoopNode('i', 'range(0, 3, 1)', [
+                    WhileLoopNode(ComparisonNode('>', a, NumberLiteralNode('1')), [PrintNode(a)]),
+                    # A sibling after the nested loop stays in the for body
+                    PrintNode(i),
+                ], ('0', '3', '1')),
+                PrintNode(a),
+            ]),
+        ]))
+
+    def test_for_loop_range_forms(self):
+        cases = {
+            "for (int i = 0; i < n; i++) {": ('range(0, n, 1)', ('0', 'n', '1')),
+            "for (int i = 10; i > 0; i--) {": ('range(0, 10, -1)', ('0', '10', '-1')),
+            "for (int j = 0; j < 20; j += 5) {": ('range(0, 20, 5)', ('0', '20', '5')),
+            "for (int j = 20; j > 0; j -= 5) {": ('range(0, 20, -5)', ('0', '20', '-5')),
+        }
+        for header, (iterable, range_info) in cases.items():
+            with self.subTest(header=header):
+                loop = parse_cpp(header + "\n    cout << i;\n}").statements[0]
+                self.assertEqual((loop.iterable, loop.range_info), (iterable, range_info))
+
+    def test_cout_chains(self):
+        cases = {
+            # Each '<<' operand is joined to the previous ones with '+'
+            'cout << "a" << b << endl;': MathOpNode(
+                '+', MathOpNode('+', StringLiteralNode('a'), VariableNode('b')), VariableNode('endl')
+            ),
+            # '<<' inside a string literal is not a separator
+            'std::cout << "x << y" << z;': MathOpNode('+', StringLiteralNode('x << y'), VariableNode('z')),
+            'cout << pow(a + 1, 2);': PowerNode(
+                MathOpNode('+', VariableNode('a'), NumberLiteralNode('1')), NumberLiteralNode('2')
+            ),
+        }
+        for line, expression in cases.items():
+            with self.subTest(line=line):
+                assert_same_tree(self, parse_cpp(line).statements, [PrintNode(expression)])
+
+    def test_string_escapes(self):
+        cases = {
+            r'cout << "tab\there\n";': 'tab\there\n',
+            r'cout << "back\\slash";': 'back\\slash',
+            r'cout << "say \"hi\"";': 'say "hi"',
+            r'cout << "\x41";': 'A',
+            # Characters outside Latin-1 survive the escape decoding
+            'cout << "café 日\\t";': 'café 日\t',
+            # '\?' is a C++ escape that Python does not have
+            r'cout << "why\?";': 'why?',
+            # Octal and universal character name escapes
+            r'cout << "\101\u00e9";': 'Aé',
+        }
+        for line, value in cases.items():
+            with self.subTest(line=line):
+                assert_same_tree(self, parse_cpp(line).statements, [PrintNode(StringLiteralNode(value))])
+
+    def test_malformed_escape_is_kept_as_written(self):
+        cases = {
+            # A trailing lone backslash
+            '"a\\"': 'a\\',
+            # Escapes C++ does not define, also before a non-Latin-1 character
+            '"\\€"': '\\€',
+            r'"\q"': r'\q',
+        }
+        for literal, value in cases.items():
+            with self.subTest(literal=literal), warnings.catch_warnings():
+                warnings.simplefilter('error')
+                self.assertEqual(_parse_string_literal(literal), value)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# universal_code_converter/tests/test_java_parser.py
+import unittest
+
+from ast_module.universal_ast import (
+    ProgramNode, FunctionNode, PrintNode, MathOpNode, VariableNode,
+    StringLiteralNode, NumberLiteralNode, ForLoopNode, WhileLoopNode,
+    ComparisonNode, AssignmentNode, LazyBody
+)
+from generators.base_generator import PythonGenerator, JavaGenerator, CppGenerator
+from parsers.java_parser import parse_java, _convert_java_for_to_range
+from tests.support import assert_matches_golden, assert_same_tree, read_golden
+
+class JavaGoldenTest(unittest.TestCase):
+    def test_conversions_match_golden(self):
+        assert_matches_golden(self, 'java')
+
+class JavaParserTest(unittest.TestCase):
+    def test_nested_blocks(self):
+        source = (
+            "public static void f(int a) {\n"
+            "    for (int i = 0; i < 3; i++) {\n"
+            "        while (a > 1) {\n"
+            "            a = a + -1\n"
+            "        }\n"
+            "        a = a + i\n"
+            "    }\n"
+            "    System.out.println(a);\n"
+            "}\n"
+            "x = 1\n"
+        )
+        a, i = VariableNode('a'), VariableNode('i')
+        assert_same_tree(self, parse_java(source), ProgramNode([
+            FunctionNode('f', ['a'], [
+                ForLoopNode('i', 'range(0, 3, 1)', [
+                    WhileLoopNode(ComparisonNode('>', a, NumberLiteralNode('1')), [
+                        AssignmentNode(a, MathOpNode('+', a, NumberLiteralNode('-1'))),
+                    ]),
+                    # A sibling after the nested loop stays in the for body
+                    AssignmentNode(a, MathOpNode('+', a, i)),
+                ], ('0', '3', '1')),
+                PrintNode(a),
+            ]),
+            AssignmentNode(VariableNode('x'), NumberLiteralNode('1')),
+        ]))
+
+    def test_for_loop_range_forms(self):
+        cases = {
+            "for (int i = 0; i < n; i++) {": ('range(0, n, 1)', ('0', 'n', '1')),
+            "for (int i = 10; i > 0; i--) {": ('range(0, 10, -1)', ('0', '10', '-1')),
+            "for (i = 0; i < 20; i += 5) {": ('range(0, 20, 5)', ('0', '20', '5')),
+            "for (int i = 9; i > 0; i -= 3) {": ('range(0, 9, -3)', ('0', '9', '-3')),
+        }
+        for header, (iterable, range_info) in cases.items():
+            with self.subTest(header=header):
+                loop = parse_java(header + "\n    x = i\n}").statements[0]
+                self.assertEqual((loop.iterable, loop.range_info), (iterable, range_info))
+
+    def test_range_conversion_table(self):
+        self.assertEqual(_convert_java_for_to_range(' 0 ', ' n ', '<=', '++', ''),
+                         ('range(0, n + 1, 1)', ('0', 'n + 1', '1')))
+        self.assertEqual(_convert_java_for_to_range('0', 'n', '>=', '-=', '2'),
+                         ('range(0, n, -2)', ('0', 'n', '-2')))
+
+    def test_print_arguments(self):
+        x = VariableNode('x')
+        cases = {
+            'System.out.println("hi");': StringLiteralNode('hi'),
+            'System.out.println(42);': NumberLiteralNode('42'),
+            'System.out.println(x);': x,
+            # The argument ends at the call's own closing parenthesis
+            'System.out.println(x + 1); foo(y)': MathOpNode('+', x, NumberLiteralNode('1')),
+            'System.out.println(f(x) + "a)");':
+                MathOpNode('+', VariableNode('f(x)'), StringLiteralNode('a)')),
+        }
+        for line, expression in cases.items():
+            with self.subTest(line=line):
+                assert_same_tree(self, parse_java(line).statements, [PrintNode(expression)])
+
+    def test_parameter_names(self):
+        source = "public static void f(Map<String, List<Integer>> m, int a[], String... rest) {\n}"
+        self.assertEqual(parse_java(source).statements[0].args, ['m', 'a', 'rest'])
+
+    def test_lazy_matches_eager(self):
+        source = read_golden('java_source.txt')
+        eager = parse_java(source)
+        lazy = parse_java(source, lazy=True)
+        self.assertIsInstance(lazy.statements[0].body, LazyBody)
+        assert_same_tree(self, lazy, eager)
+        for generator_class in (PythonGenerator, JavaGenerator, CppGenerator):
+            with self.subTest(generator=generator_class.__name__):
+                self.assertEqual(generator_class().visit(parse_java(source, lazy=True)),
+                                 generator_class().visit(eager))
+
+    def test_lazy_body_is_parsed_on_first_use(self):
+        body = parse_java("public static void f() {\n    x = 1\n}", lazy=True).statements[0].body
+        self.assertIsNone(body._statements)
+        self.assertEqual(len(body), 1)
+        assert_same_tree(self, body[0], AssignmentNode(VariableNode('x'), NumberLiteralNode('1')))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# universal_code_converter/tests/test_python_parser.py
+import unittest
+
+from ast_module.universal_ast import (
+    ProgramNode, FunctionNode, MathOpNode, VariableNode, StringLiteralNode,
+    NumberLiteralNode, PowerNode, ForLoopNode, WhileLoopNode,
+    ComparisonNode, AssignmentNode, LazyBody
+)
+from generators.base_generator import PythonGenerator, JavaGenerator, CppGenerator
+from parsers.python_parser import parse_python
+from tests.support import assert_matches_golden, assert_same_tree, read_golden
+
+class PythonGoldenTest(unittest.TestCase):
+    def test_conversions_match_golden(self):
+        assert_matches_golden(self, 'python')
+
+class PythonParserTest(unittest.TestCase):
+    def test_nested_blocks(self):
+        source = (
+            "def f(a):\n"
+            "    for i in range(3):\n"
+            "        while a > 1:\n"
+            "            a = a + -1\n"
+            "        a = a + i\n"
+            "    g(a)\n"
+            "# comment\n"
+            "x = 1\n"
+        )
+        a, i = VariableNode('a'), VariableNode('i')
+        assert_same_tree(self, parse_python(source), ProgramNode([
+            FunctionNode('f', ['a'], [
+                ForLoopNode('i', VariableNode('range(3)'), [
+                    WhileLoopNode(ComparisonNode('>', a, NumberLiteralNode('1')), [
+                        AssignmentNode(a, MathOpNode('+', a, NumberLiteralNode('-1'))),
+                    ]),
+                    # A sibling after the nested loop stays in the for body
+                    AssignmentNode(a, MathOpNode('+', a, i)),
+                ]),
+                FunctionNode('g', ['a'], []),
+            ]),
+            AssignmentNode(VariableNode('x'), NumberLiteralNode('1')),
+        ]))
+
+    def test_print_is_parsed_as_a_call(self):
+        assert_same_tree(self, parse_python("print(x + 1)").statements,
+                         [FunctionNode('print', ['x + 1'], [])])
+
+    def test_expressions(self):
+        a, b = VariableNode('a'), VariableNode('b')
+        a_plus_1 = MathOpNode('+', a, NumberLiteralNode('1'))
+        cases = {
+            # '+' inside a string literal is not an operator
+            's = "a + b"': StringLiteralNode('a + b'),
+            'y = a + b + c': MathOpNode('+', MathOpNode('+', a, b), VariableNode('c')),
+            'z = pow(a + 1, 2)': PowerNode(a_plus_1, NumberLiteralNode('2')),
+            'c = a + 1 == b': ComparisonNode('==', a_plus_1, b),
+        }
+        for line, value in cases.items():
+            with self.subTest(line=line):
+                assignment = parse_python(line).statements[0]
+                assert_same_tree(self, assignment.value, value)
+
+    def test_lazy_matches_eager(self):
+        source = read_golden('python_source.txt')
+        eager = parse_python(source)
+        lazy = parse_python(source, lazy=True)
+        self.assertIsInstance(lazy.statements[0].body, LazyBody)
+        assert_same_tree(self, lazy, eager)
+        for generator_class in (PythonGenerator, JavaGenerator, CppGenerator):
+            with self.subTest(generator=generator_class.__name__):
+                self.assertEqual(generator_class().visit(parse_python(source, lazy=True)),
+                                 generator_class().visit(eager))
+
+    def test_deep_nesting_does_not_recurse(self):
+        depth = 3000
+        source = ''.join('    ' * level + 'while x:\n' for level in range(depth))
+        source += '    ' * depth + 'x = 1\n'
+        loop = parse_python(source).statements[0]
+        for _ in range(depth - 1):
+            loop = loop.body[0]
+        assert_same_tree(self, loop.body, [AssignmentNode(VariableNode('x'), NumberLiteralNode('1'))])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 # universal_code_converter/transformers/java_transformer.py
 
+# A pass-through for now; see TRANSFORMERS in main.py
+IDENTITY_TRANSFORM = True
+
 def transform_to_java_ast(ast):
     """Placeholder transformer that returns the AST unchanged."""
     return ast
@@ -5,7 +5,10 @@
 # before generation, e.g., converting complex Python comprehensions to loops
 # if the target language doesn't support them directly.
 
-# For now, this can be a pass-through or identity transformer.
+# For now, this is a pass-through (identity) transformer; see TRANSFORMERS
+# in main.py.
+IDENTITY_TRANSFORM = True
+
 def transform_to_python_ast(ast):
     """Placeholder transformer that returns the AST unchanged."""
     return ast